@@ -2,10 +2,13 @@ import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 import pickle
 
+FEATURES = ["open_issues", "net_profit", "vacancy_rate"]
+TARGET = "health_flag"
+
 def train_health_model():
-    df = pd.read_csv("training_data/asset_health.csv")
-    X = df[["open_issues", "net_profit", "vacancy_rate"]]
-    y = df["health_flag"]
+    df = pd.read_csv("training_data/asset_health.csv", usecols=FEATURES + [TARGET])
+    X = df[FEATURES]
+    y = df[TARGET]
     model = RandomForestClassifier()
     model.fit(X, y)
     with open("models/health_model.pkl", "wb") as f:
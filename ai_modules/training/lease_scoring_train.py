@@ -2,10 +2,13 @@ import pandas as pd
 from sklearn.linear_model import LogisticRegression
 import pickle
 
+FEATURES = ["late_payments", "on_time_months", "complaints"]
+TARGET = "defaulted"
+
 def train_lease_model():
-    df = pd.read_csv("training_data/lease_history.csv")
-    X = df[["late_payments", "on_time_months", "complaints"]]
-    y = df["defaulted"]
+    df = pd.read_csv("training_data/lease_history.csv", usecols=FEATURES + [TARGET])
+    X = df[FEATURES]
+    y = df[TARGET]
     model = LogisticRegression()
     model.fit(X, y)
     with open("models/lease_model.pkl", "wb") as f:
@@ -2,10 +2,13 @@ import pandas as pd
 from sklearn.linear_model import LogisticRegression
 import pickle
 
+FEATURES = ["age_months", "last_service_months_ago", "incident_reports"]
+TARGET = "likely_failure"
+
 def train_maintenance_model():
-    df = pd.read_csv("training_data/maintenance_data.csv")
-    X = df[["age_months", "last_service_months_ago", "incident_reports"]]
-    y = df["likely_failure"]
+    df = pd.read_csv("training_data/maintenance_data.csv", usecols=FEATURES + [TARGET])
+    X = df[FEATURES]
+    y = df[TARGET]
     model = LogisticRegression()
     model.fit(X, y)
     with open("models/maintenance_model.pkl", "wb") as f:
@@ -2,10 +2,13 @@ import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 import pickle
 
+FEATURES = ["late_payments", "average_days_late", "months_paid_on_time"]
+TARGET = "likely_to_be_late"
+
 def train_rent_delay_model():
-    df = pd.read_csv("training_data/rent_history.csv")
-    X = df[["late_payments", "average_days_late", "months_paid_on_time"]]
-    y = df["likely_to_be_late"]
+    df = pd.read_csv("training_data/rent_history.csv", usecols=FEATURES + [TARGET])
+    X = df[FEATURES]
+    y = df[TARGET]
     model = RandomForestClassifier()
     model.fit(X, y)
     with open("models/rent_delay_model.pkl", "wb") as f:
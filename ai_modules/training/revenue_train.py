@@ -2,10 +2,13 @@ import pandas as pd
 from sklearn.linear_model import LinearRegression
 import pickle
 
+FEATURES = ["units", "expected_rent", "actual_collected"]
+TARGET = "leakage_flag"
+
 def train_revenue_model():
-    df = pd.read_csv("training_data/revenue_data.csv")
-    X = df[["units", "expected_rent", "actual_collected"]]
-    y = df["leakage_flag"]
+    df = pd.read_csv("training_data/revenue_data.csv", usecols=FEATURES + [TARGET])
+    X = df[FEATURES]
+    y = df[TARGET]
     model = LinearRegression()
     model.fit(X, y)
     with open("models/revenue_model.pkl", "wb") as f:
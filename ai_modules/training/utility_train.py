@@ -2,10 +2,13 @@ import pandas as pd
 from sklearn.linear_model import LinearRegression
 import pickle
 
+FEATURES = ["avg_temp", "occupants", "unit_size_sqft"]
+TARGET = "monthly_usage"
+
 def train_utility_model():
-    df = pd.read_csv("training_data/utility_data.csv")
-    X = df[["avg_temp", "occupants", "unit_size_sqft"]]
-    y = df["monthly_usage"]
+    df = pd.read_csv("training_data/utility_data.csv", usecols=FEATURES + [TARGET])
+    X = df[FEATURES]
+    y = df[TARGET]
     model = LinearRegression()
     model.fit(X, y)
     with open("models/utility_model.pkl", "wb") as f:
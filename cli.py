@@ -1,4 +1,5 @@
 import click
+from sqlalchemy import select
 from flask.cli import with_appcontext
 from . import db
 from .models.user import User, UserRole  # fixed import
@@ -9,7 +10,7 @@ from .models.user import User, UserRole  # fixed import
 @with_appcontext
 def create_superadmin(email, password):
     email = email.strip().lower()
-    u = User.query.filter_by(email=email).first()
+    u = db.session.execute(select(User).where(User.email == email)).scalar_one_or_none()
     if u:
         click.echo(f"User already exists: {email}")
         return
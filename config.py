@@ -13,6 +13,28 @@ class Config:
         raise ValueError("DATABASE_URL environment variable must be set")
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", 1800)),
+        "insertmanyvalues_page_size": 1000,
+    }
+
+    _db_scheme = SQLALCHEMY_DATABASE_URI.split("://", 1)[0]
+
+    # Connection pool (per worker process), sized to the worker's thread count.
+    # Total connections are workers * (pool_size + max_overflow); the gunicorn
+    # config caps its default worker count to keep that within
+    # DB_MAX_CONNECTIONS. SQLite's in-memory pool does not take these arguments.
+    if not _db_scheme.startswith("sqlite"):
+        SQLALCHEMY_ENGINE_OPTIONS["pool_size"] = int(
+            os.environ.get("DB_POOL_SIZE", os.environ.get("GUNICORN_THREADS", 4))
+        )
+        SQLALCHEMY_ENGINE_OPTIONS["max_overflow"] = int(os.environ.get("DB_MAX_OVERFLOW", 2))
+
+    # psycopg2: batch executemany() UPDATE/DELETE statements as well as INSERTs
+    if _db_scheme in ("postgresql", "postgresql+psycopg2"):
+        SQLALCHEMY_ENGINE_OPTIONS["executemany_mode"] = "values_plus_batch"
     
     # JWT Configuration
     JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY", SECRET_KEY)
@@ -1,5 +1,18 @@
+import multiprocessing
+import os
 
 bind = "127.0.0.1:8000"
-workers = 3
-threads = 2
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# Each worker holds its own DB pool (Config: DB_POOL_SIZE defaults to
+# GUNICORN_THREADS, plus DB_MAX_OVERFLOW), so cap the default worker count
+# at what fits in DB_MAX_CONNECTIONS
+_conns_per_worker = int(os.environ.get("DB_POOL_SIZE", threads)) + int(os.environ.get("DB_MAX_OVERFLOW", 2))
+_db_budget = int(os.environ.get("DB_MAX_CONNECTIONS", 90))
+workers = int(os.environ.get(
+    "WEB_CONCURRENCY",
+    max(1, min(multiprocessing.cpu_count() * 2 + 1, _db_budget // _conns_per_worker)),
+))
 timeout = 60
+preload_app = True
@@ -1,5 +1,6 @@
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+from sqlalchemy import func, insert
 from .models import db, AuditEvent, FeatureUsageDaily, UsageSummary
 
 # Consider these as app features to track (customize as needed)
@@ -15,37 +16,53 @@ TRACKED_FEATURES = [
 
 def recompute_usage_stats(days:int=30, client_id:int=None):
     cutoff = datetime.utcnow() - timedelta(days=days)
-    q = db.session.query(AuditEvent).filter(AuditEvent.created_at>=cutoff)
+
+    # roll up by day and feature in the database
+    day_col = func.date(AuditEvent.created_at)
+    q = db.session.query(AuditEvent.client_id, AuditEvent.action, day_col, func.count(AuditEvent.id)).filter(
+        AuditEvent.created_at>=cutoff,
+        AuditEvent.entity_type=="feature",
+        AuditEvent.action.in_(TRACKED_FEATURES),
+    )
     if client_id is not None:
         q = q.filter(AuditEvent.client_id==client_id)
+    q = q.group_by(AuditEvent.client_id, AuditEvent.action, day_col)
+    day_counts = {(cid, action, str(day)): cnt for cid, action, day, cnt in q.all()}
 
-    # roll up by day and feature
-    day_counts = defaultdict(int)
-    events = q.all()
-    for ev in events:
-        if ev.entity_type == "feature" and ev.action in TRACKED_FEATURES:
-            day = ev.created_at.strftime("%Y-%m-%d")
-            key = (ev.client_id, ev.action, day)
-            day_counts[key] += 1
-
-    # upsert into FeatureUsageDaily
-    for (cid, feature, day), cnt in day_counts.items():
-        row = FeatureUsageDaily.query.filter_by(client_id=cid, feature=feature, day=day).first()
-        if not row:
-            row = FeatureUsageDaily(client_id=cid, feature=feature, day=day, count=cnt)
-            db.session.add(row)
-        else:
-            row.count = cnt
+    # upsert into FeatureUsageDaily: load the existing rows in one query,
+    # update those in place and insert the rest with a single executemany
+    clients = set(cid for (cid, _, _) in day_counts.keys())
+    if day_counts:
+        day_keys = set(day for (_, _, day) in day_counts.keys())
+        existing = {
+            (r.client_id, r.feature, r.day): r
+            for r in FeatureUsageDaily.query.filter(
+                FeatureUsageDaily.client_id.in_(clients),
+                FeatureUsageDaily.day.in_(day_keys),
+            )
+        }
+        new_rows = []
+        for (cid, feature, day), cnt in day_counts.items():
+            row = existing.get((cid, feature, day))
+            if not row:
+                new_rows.append({"client_id": cid, "feature": feature, "day": day, "count": cnt})
+            else:
+                row.count = cnt
+        if new_rows:
+            db.session.execute(insert(FeatureUsageDaily), new_rows)
 
     db.session.commit()
 
-    # compute summary per client
-    clients = set(cid for (cid, _, _) in day_counts.keys())
+    # compute summary per client from per-feature totals summed in the database
+    totals = defaultdict(Counter)
+    if clients:
+        q = db.session.query(
+            FeatureUsageDaily.client_id, FeatureUsageDaily.feature, func.sum(FeatureUsageDaily.count)
+        ).filter(FeatureUsageDaily.client_id.in_(clients)).group_by(FeatureUsageDaily.client_id, FeatureUsageDaily.feature)
+        for cid, feature, n in q:
+            totals[cid][feature] = n or 0
     for cid in clients:
-        rows = FeatureUsageDaily.query.filter_by(client_id=cid).all()
-        total = Counter()
-        for r in rows:
-            total[r.feature] += r.count
+        total = totals[cid]
         top = total.most_common(5)
         under = [f for f in TRACKED_FEATURES if total[f] == 0]
         summary = UsageSummary.query.filter_by(client_id=cid).order_by(UsageSummary.computed_at.desc()).first()
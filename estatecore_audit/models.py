@@ -25,6 +25,10 @@ class FeatureUsageDaily(db.Model):
     day = Column(String(10), index=True, nullable=False)   # YYYY-MM-DD
     count = Column(Integer, default=0)
 
+    __table_args__ = (
+        Index("ix_feature_usage_daily_client_feature_day", "client_id", "feature", "day"),
+    )
+
 class UsageSummary(db.Model):
     __tablename__ = "usage_summary"
     id = Column(Integer, primary_key=True)
@@ -32,3 +36,7 @@ class UsageSummary(db.Model):
     computed_at = Column(DateTime, default=datetime.utcnow)
     top_features = Column(JSON, nullable=True)  # [{"feature":"X","count":N}, ...]
     underused_features = Column(JSON, nullable=True)
+
+    __table_args__ = (
+        Index("ix_usage_summary_client_computed", "client_id", "computed_at"),
+    )
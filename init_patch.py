@@ -10,7 +10,12 @@ def load_user_from_token():
     if not auth or not auth.startswith('Bearer '):
         g.current_user = None
         return
-    token = auth.split()[1]
+    token = auth[7:].strip()
+    # A JWT is exactly three dot-separated segments; reject anything else
+    # before paying for signature verification.
+    if token.count('.') != 2:
+        g.current_user = None
+        return
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
         g.current_user = User.query.get(payload['user_id'])
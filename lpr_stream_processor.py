@@ -8,6 +8,8 @@ the Instagate backend at `/lpr-event`.  The recognition logic is kept in
 
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import requests
 
@@ -22,18 +24,53 @@ API_KEY = os.environ.get("OPENALPR_API_KEY", "")
 SAVE_FOLDER = os.environ.get("LPR_SAVE_FOLDER", "captured_frames")
 # Process every Nth frame to reduce API usage
 FRAME_SKIP = int(os.environ.get("LPR_FRAME_SKIP", "30"))
+# Maximum number of frames being recognized concurrently
+LPR_WORKERS = int(os.environ.get("LPR_WORKERS", "4"))
 
 # Ensure the save folder exists
 os.makedirs(SAVE_FOLDER, exist_ok=True)
 
 
+def process_frame(image_path: str, timestamp: int) -> None:
+    """Recognize a saved frame and forward any detected plate to the backend."""
+    plate, conf = recognize_plate(image_path, API_KEY)
+    if plate:
+        print(f"[✓] Plate: {plate} | Confidence: {conf:.1f}%")
+        # send detected plate to backend
+        try:
+            resp = requests.post(
+                "http://127.0.0.1:5000/lpr-event",
+                json={"plate": plate, "confidence": conf, "timestamp": timestamp},
+                timeout=3,
+            )
+            if resp.status_code != 200:
+                print(f"Backend responded with status {resp.status_code}: {resp.text}")
+        except requests.RequestException as exc:
+            print(f"Error posting to backend: {exc}")
+    else:
+        print("[x] No plate detected.")
+
+
+def _report_failure(future) -> None:
+    """Print errors from a finished frame job; nothing else reads its result."""
+    exc = future.exception()
+    if exc is not None:
+        print(f"Error processing frame: {exc!r}")
+
+
 def main() -> None:
-    """Connect to the camera and process frames indefinitely."""
+    """Connect to the camera and process frames indefinitely.
+
+    Recognition and the backend post are network bound, so they run on a
+    small worker pool while this loop keeps reading frames from the camera.
+    """
     cap = cv2.VideoCapture(RTSP_URL)
     if not cap.isOpened():
         print(f"Failed to connect to camera at {RTSP_URL}.")
         return
 
+    pool = ThreadPoolExecutor(max_workers=LPR_WORKERS)
+    in_flight = set()
     frame_count = 0
     while True:
         ret, frame = cap.read()
@@ -42,27 +79,17 @@ def main() -> None:
             break
 
         if frame_count % FRAME_SKIP == 0:
-            timestamp = int(time.time())
-            image_path = os.path.join(SAVE_FOLDER, f"frame_{timestamp}.jpg")
-            cv2.imwrite(image_path, frame)
-
-            # Recognize plate using external API
-            plate, conf = recognize_plate(image_path, API_KEY)
-            if plate:
-                print(f"[✓] Plate: {plate} | Confidence: {conf:.1f}%")
-                # send detected plate to backend
-                try:
-                    resp = requests.post(
-                        "http://127.0.0.1:5000/lpr-event",
-                        json={"plate": plate, "confidence": conf, "timestamp": timestamp},
-                        timeout=3,
-                    )
-                    if resp.status_code != 200:
-                        print(f"Backend responded with status {resp.status_code}: {resp.text}")
-                except requests.RequestException as exc:
-                    print(f"Error posting to backend: {exc}")
-            else:
-                print("[x] No plate detected.")
+            in_flight = {f for f in in_flight if not f.done()}
+            # Drop the frame rather than queue it if every worker is busy
+            if len(in_flight) < LPR_WORKERS:
+                timestamp = int(time.time())
+                # Nanosecond names so a frame from the same second doesn't
+                # overwrite one a worker is still uploading
+                image_path = os.path.join(SAVE_FOLDER, f"frame_{time.time_ns()}.jpg")
+                cv2.imwrite(image_path, frame)
+                future = pool.submit(process_frame, image_path, timestamp)
+                future.add_done_callback(_report_failure)
+                in_flight.add(future)
 
         frame_count += 1
         cv2.imshow("LPR Camera", frame)
@@ -71,6 +98,7 @@ def main() -> None:
 
     cap.release()
     cv2.destroyAllWindows()
+    pool.shutdown(wait=True)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,13 @@
 from werkzeug.security import generate_password_hash, check_password_hash
 
+PASSWORD_HASH_METHOD = "pbkdf2:sha256:600000"
+
 class User(db.Model):
     ...
     password_hash = db.Column(db.String(128), nullable=False)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
 
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
@@ -11,6 +11,8 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 
+from estatecore_backend.utils.json_provider import ORJSONProvider
+
 from .config import Config
 
 # Initialise extensions (instances are defined at module level but initialised
@@ -23,6 +25,7 @@ def create_app() -> Flask:
     """Create and return a configured Flask application."""
     app = Flask(__name__)
     app.config.from_object(Config)
+    app.json = ORJSONProvider(app)
     
     # Initialise database and migration extensions
     db.init_app(app)
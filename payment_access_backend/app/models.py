@@ -4,7 +4,7 @@ Database models for the payment‑based access control system.
 These models define the structure of the database tables used by the
 application.  They cover organisations, locations, users (with roles), invite
 tokens, payments/subscriptions, and licence plate recognition events.  The
-`Payment` model supports both monthly subscriptions (via `valid_until`) and
+`PlatePayment` model supports both monthly subscriptions (via `valid_until`) and
 per‑use credits (`remaining_uses`).
 """
 
@@ -12,10 +12,14 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import update
 from werkzeug.security import generate_password_hash, check_password_hash
 
 from . import db
 
+# Pinned so hashing cost is explicit and the result fits password_hash (128).
+PASSWORD_HASH_METHOD = "pbkdf2:sha256:600000"
+
 
 def gen_uuid() -> str:
     return str(uuid.uuid4())
@@ -45,7 +49,7 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     def set_password(self, password: str) -> None:
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
 
     def check_password(self, password: str) -> bool:
         return check_password_hash(self.password_hash, password)
@@ -62,14 +66,16 @@ class InviteToken(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 
-class Payment(db.Model):
+class PlatePayment(db.Model):
     """Represents a payment record or subscription for a licence plate.
 
-    A `Payment` record is considered valid if either:
+    A `PlatePayment` record is considered valid if either:
     - `payment_type` is 'monthly' and `valid_until` is in the future; or
     - `payment_type` is 'per_use' and `remaining_uses` is greater than zero.
     """
 
+    __tablename__ = "payment"
+
     id = db.Column(db.Integer, primary_key=True)
     plate = db.Column(db.String(32), unique=True, nullable=False)
     payment_type = db.Column(db.String(20), nullable=False)  # 'monthly' or 'per_use'
@@ -91,13 +97,22 @@ class Payment(db.Model):
         return False
 
     def consume_use(self) -> bool:
-        """Decrement a per‑use payment and return True if successful."""
+        """Decrement a per‑use payment and return True if successful.
+
+        The decrement is a single conditional UPDATE, so two concurrent
+        access checks for the same plate cannot both spend the last use.
+        The caller commits.
+        """
         if self.payment_type != 'per_use':
             return False
-        if self.remaining_uses and self.remaining_uses > 0:
-            self.remaining_uses -= 1
-            return True
-        return False
+        result = db.session.execute(
+            update(PlatePayment)
+            .where(PlatePayment.id == self.id, PlatePayment.remaining_uses > 0)
+            .values(remaining_uses=PlatePayment.remaining_uses - 1)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.expire(self, ['remaining_uses'])
+        return result.rowcount == 1
 
 
 class LPREvent(db.Model):
@@ -126,6 +141,9 @@ class RentInvoice(db.Model):
 
 
 class Payment(db.Model):
+    # Own table: PlatePayment above maps "payment"
+    __tablename__ = "rent_payment"
+
     id = db.Column(db.Integer, primary_key=True)
     tenant_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     invoice_id = db.Column(db.Integer, db.ForeignKey('rent_invoice.id'), nullable=True)
@@ -136,6 +154,11 @@ class Payment(db.Model):
     tenant = db.relationship('User', backref='payments')
     invoice = db.relationship('RentInvoice', backref='payments')
 
+    __table_args__ = (
+        db.Index('ix_rent_payment_invoice_id', 'invoice_id'),
+        db.Index('ix_rent_payment_tenant_date', 'tenant_id', 'payment_date'),
+    )
+
 class MaintenanceRequest(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     tenant_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -1,11 +1,17 @@
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, jsonify, g, Response
 from estatecore_backend.models import db, InviteToken, User, Organization, RentInvoice, Payment, Property
 from datetime import datetime, timedelta
-import uuid
+import json
+import secrets
+import time
 from functools import wraps
 
 main = Blueprint('main', __name__)
 
+# Fixed error bodies are serialized once at import instead of per miss.
+_INVOICE_NOT_FOUND = json.dumps({'error': 'Invoice not found'})
+_NO_PAYMENTS_FOUND = json.dumps({'error': 'No payments found for this invoice'})
+
 # -----------------------------
 # Role-Based Access Decorator
 # -----------------------------
@@ -46,7 +52,7 @@ def generate_test_invite():
     if not all([email, role, organization_id]):
         return jsonify({'error': 'Missing required fields'}), 400
 
-    token = str(uuid.uuid4())
+    token = secrets.token_hex(18)
     invite = InviteToken(
         email=email,
         role=role,
@@ -64,41 +70,61 @@ def generate_test_invite():
 def register_with_token(token):
     invite = InviteToke
 
-@main.route('/super-admin/overview', methods=['GET'])
-@require_roles('super_admin')
-def super_admin_overview():
-    from sqlalchemy import func
+# Platform totals change slowly but the dashboard polls them; serve a
+# per-process copy for this many seconds before recomputing.
+OVERVIEW_CACHE_TTL = 30
+_overview_cache = {'expires': 0.0, 'data': None}
+
+
+def _compute_overview():
+    from sqlalchemy import func, select
 
-    total_orgs = db.session.query(func.count(Organization.id)).scalar()
-    total_users = db.session.query(func.count(User.id)).scalar()
-    total_properties = db.session.query(func.count(Property.id)).scalar()
-    total_due = db.session.query(func.sum(RentInvoice.amount_due)).scalar() or 0.0
-    total_paid = db.session.query(func.sum(Payment.amount_paid)).scalar() or 0.0
+    # One round trip: each total is a scalar subquery of a single SELECT
+    total_orgs, total_users, total_properties, total_due, total_paid = db.session.execute(select(
+        select(func.count(Organization.id)).scalar_subquery(),
+        select(func.count(User.id)).scalar_subquery(),
+        select(func.count(Property.id)).scalar_subquery(),
+        select(func.coalesce(func.sum(RentInvoice.amount_due), 0.0)).scalar_subquery(),
+        select(func.coalesce(func.sum(Payment.amount_paid), 0.0)).scalar_subquery(),
+    )).one()
 
-    return jsonify({
+    return {
         'total_organizations': total_orgs,
         'total_users': total_users,
         'total_properties': total_properties,
         'total_rent_due': round(total_due, 2),
         'total_rent_collected': round(total_paid, 2),
         'total_outstanding': round(total_due - total_paid, 2)
-    }), 200
+    }
+
+
+@main.route('/super-admin/overview', methods=['GET'])
+@require_roles('super_admin')
+def super_admin_overview():
+    now = time.monotonic()
+    if _overview_cache['data'] is None or now >= _overview_cache['expires']:
+        _overview_cache['data'] = _compute_overview()
+        _overview_cache['expires'] = now + OVERVIEW_CACHE_TTL
+    return jsonify(_overview_cache['data']), 200
 from io import BytesIO
 from flask import send_file
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
 # Generate PDF Rent Receipt by Invoice
 @main.route('/receipt/<int:invoice_id>', methods=['GET'])
 @require_roles('super_admin', 'property_manager', 'property_admin', 'tenant')
 def generate_receipt(invoice_id):
-    invoice = RentInvoice.query.get(invoice_id)
+    # The receipt prints the tenant name, so load it with the invoice
+    invoice = db.session.get(RentInvoice, invoice_id, options=[joinedload(RentInvoice.tenant)])
     if not invoice:
-        return jsonify({'error': 'Invoice not found'}), 404
+        return Response(_INVOICE_NOT_FOUND, status=404, mimetype='application/json')
 
     payments = Payment.query.filter_by(invoice_id=invoice_id).all()
     if not payments:
-        return jsonify({'error': 'No payments found for this invoice'}), 404
+        return Response(_NO_PAYMENTS_FOUND, status=404, mimetype='application/json')
 
     buffer = BytesIO()
     p = canvas.Canvas(buffer, pagesize=letter)
@@ -111,17 +137,20 @@ def generate_receipt(invoice_id):
     p.drawString(50, 670, f"Due Date: {invoice.due_date.strftime('%Y-%m-%d')}")
 
     y = 640
+    total_paid = 0.0
     for pay in payments:
         p.drawString(50, y, f"Payment: ${pay.amount_paid:.2f} on {pay.payment_date.strftime('%Y-%m-%d')} ({pay.method})")
+        total_paid += pay.amount_paid
         y -= 20
 
-    p.drawString(50, y - 20, f"Total Paid: ${sum(p.amount_paid for p in payments):.2f}")
+    p.drawString(50, y - 20, f"Total Paid: ${total_paid:.2f}")
     p.showPage()
     p.save()
     buffer.seek(0)
 
     return send_file(buffer, as_attachment=True, download_name=f"receipt_{invoice_id}.pdf", mimetype='application/pdf')
-@bp.route("/users")
+@main.route("/users")
+@require_roles('super_admin')
 def get_users():
-    users = User.query.all()
-    return jsonify([u.email for u in users])
+    emails = db.session.execute(select(User.email).order_by(User.id)).scalars().all()
+    return jsonify(emails)
@@ -1,6 +1,7 @@
 from estatecore_backend import create_app
 from estatecore_backend.models import db, User
 from werkzeug.security import generate_password_hash
+from sqlalchemy import select
 
 app = create_app()
 
@@ -11,16 +12,24 @@ with app.app_context():
         {"name": "Tenant User", "email": "tenant@demo.com", "password": "tenant123", "role": "tenant"},
     ]
 
+    # One SELECT for every email already present instead of one per demo user
+    existing = set(db.session.execute(
+        select(User.email).where(User.email.in_([u["email"] for u in demo_users]))
+    ).scalars())
+
+    new_users = []
     for user_data in demo_users:
-        existing = User.query.filter_by(email=user_data["email"]).first()
-        if not existing:
-            user = User(
-                name=user_data["name"],
-                email=user_data["email"],
-                password=generate_password_hash(user_data["password"]),
-                role=user_data["role"]
-            )
-            db.session.add(user)
+        if user_data["email"] not in existing:
+            existing.add(user_data["email"])
+            new_users.append({
+                "name": user_data["name"],
+                "email": user_data["email"],
+                "password": generate_password_hash(user_data["password"]),
+                "role": user_data["role"]
+            })
 
+    # One multi-row INSERT instead of a unit-of-work flush per User object
+    if new_users:
+        db.session.bulk_insert_mappings(User, new_users)
     db.session.commit()
     print("Users prefilled successfully.")
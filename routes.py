@@ -1,39 +1,52 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app, Response
 from .extensions import db
 from estatecore_backend.models import User, RentRecord, AccessLog
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask_cors import CORS
 from datetime import datetime
+import json
+from sqlalchemy import exists, select
 
 api_bp = Blueprint("api", __name__)
+# Let cross-origin browser clients read the access-log page cursor
+CORS(api_bp, expose_headers=["X-Next-Cursor"])
+
+_USER_NOT_FOUND = json.dumps({"msg": "User not found"})
+
+# Columns returned by /access-logs, read as plain rows
+ACCESS_LOG_COLS = (AccessLog.time, AccessLog.user, AccessLog.door, AccessLog.status)
+
+def _utc_timestamp():
+    """Current UTC time as "YYYY-MM-DD HH:MM:SS" (the AccessLog.time format)"""
+    return datetime.utcnow().isoformat(" ", "seconds")
 
 # ---- Access Check ----
+def _log_access(timestamp, user, status):
+    db.session.add(AccessLog(time=timestamp, user=user, door="GATE", status=status))
+    db.session.commit()
+
 @api_bp.route("/access/check", methods=["POST"])
 def access_check():
     data = request.get_json() or {}
     plate = data.get("plate")
 
-    now = datetime.utcnow()
-    timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = _utc_timestamp()
 
     if not plate:
-        log = AccessLog(time=timestamp, user="UNKNOWN", door="GATE", status="denied - no plate")
-        db.session.add(log)
-        db.session.commit()
+        _log_access(timestamp, "UNKNOWN", "denied - no plate")
         return jsonify({"access": "denied", "reason": "Plate missing"}), 400
 
     user = User.query.filter_by(plate=plate).first()
     if not user:
-        log = AccessLog(time=timestamp, user=plate, door="GATE", status="denied - unknown plate")
-        db.session.add(log)
-        db.session.commit()
+        _log_access(timestamp, plate, "denied - unknown plate")
         return jsonify({"access": "denied", "reason": "Unknown plate"}), 404
 
-    rent = RentRecord.query.filter_by(name=user.name, status="Paid").first()
+    has_paid_rent = db.session.query(
+        exists().where(RentRecord.name == user.name, RentRecord.status == "Paid")
+    ).scalar()
 
-    if rent:
-        log = AccessLog(time=timestamp, user=user.name, door="GATE", status="granted")
-        db.session.add(log)
-        db.session.commit()
+    if has_paid_rent:
+        _log_access(timestamp, user.name, "granted")
 
         # 🔁 Optional relay trigger
         # import requests
@@ -41,9 +54,7 @@ def access_check():
 
         return jsonify({"access": "granted", "user_id": user.id})
     else:
-        log = AccessLog(time=timestamp, user=user.name, door="GATE", status="denied - unpaid rent")
-        db.session.add(log)
-        db.session.commit()
+        _log_access(timestamp, user.name, "denied - unpaid rent")
         return jsonify({"access": "denied", "reason": "Unpaid rent"})
 
 # ---- Simulate Access Log ----
@@ -52,7 +63,7 @@ def access_check():
 def simulate_log():
     data = request.get_json() or {}
     log = AccessLog(
-        time=data.get("time", datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")),
+        time=data["time"] if "time" in data else _utc_timestamp(),
         user=data.get("user", "SimUser"),
         door=data.get("door", "SimDoor"),
         status=data.get("status", "SimStatus")
@@ -65,18 +76,27 @@ def simulate_log():
 @api_bp.route("/access-logs", methods=["GET"])
 @jwt_required()
 def access_logs():
-    logs = AccessLog.query.order_by(AccessLog.id.desc()).limit(20).all()
-    return jsonify([{
-        "time": l.time,
-        "user": l.user,
-        "door": l.door,
-        "status": l.status
-    } for l in logs])
+    limit = max(1, min(request.args.get("limit", 20, type=int), 100))
+    stmt = select(AccessLog.id, *ACCESS_LOG_COLS).order_by(AccessLog.id.desc()).limit(limit)
+    # Keyset pagination: "before" is the id of the last row of the previous page
+    before = request.args.get("before")
+    if before is not None:
+        try:
+            stmt = stmt.where(AccessLog.id < int(before))
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+    rows = db.session.execute(stmt).all()
+    response = jsonify([
+        {c.key: r._mapping[c.key] for c in ACCESS_LOG_COLS} for r in rows
+    ])
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = str(rows[-1].id)
+    return response
 @api_bp.route("/relay/unlock", methods=["POST"])
 @jwt_required()
 def manual_unlock():
     # Stubbed logic - replace with real relay call
-    print("Manual unlock triggered.")
+    current_app.logger.info("Manual unlock triggered.")
     return jsonify({"msg": "Relay unlock triggered"}), 200
 
 @api_bp.route("/login", methods=["POST"])
@@ -97,13 +117,10 @@ def login():
 @jwt_required()
 def me():
     user_id = get_jwt_identity()
-    user = User.query.get(user_id)
-    if not user:
-        return jsonify({"msg": "User not found"}), 404
-
-    return jsonify({
-        "id": user.id,
-        "name": user.name,
-        "email": user.email,
-        "role": user.role
-    })
\ No newline at end of file
+    row = db.session.execute(
+        select(User.id, User.name, User.email, User.role).where(User.id == user_id)
+    ).first()
+    if row is None:
+        return Response(_USER_NOT_FOUND, status=404, mimetype="application/json")
+
+    return jsonify(dict(row._mapping))
\ No newline at end of file
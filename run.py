@@ -2,8 +2,10 @@ from dotenv import load_dotenv
 import os
 from estatecore_backend import create_app
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file in development only
+# (export FLASK_ENV=development; the variable is read before .env is loaded)
+if os.getenv("FLASK_ENV") == "development":
+    load_dotenv()
 
 app = create_app()
 
@@ -4,12 +4,21 @@ from estatecore_backend.models.training_log import TrainingLog
 from estatecore_backend import db
 from datetime import datetime
 
-from estatecore_backend.ai_models.training.train_lease_model import train_lease_model
-from estatecore_backend.ai_models.training.train_rent_delay import train_rent_delay_model
-from estatecore_backend.ai_models.training.train_maintenance_forecast import train_maintenance_model
-from estatecore_backend.ai_models.training.train_utility_forecast import train_utility_model
-from estatecore_backend.ai_models.training.train_revenue_leakage import train_revenue_model
-from estatecore_backend.ai_models.training.train_asset_health_score import train_asset_health_model
+from estatecore_backend.ai_modules.training.train_lease_model import train_lease_model
+from estatecore_backend.ai_modules.training.train_rent_delay import train_rent_delay_model
+from estatecore_backend.ai_modules.training.train_maintenance_forecast import train_maintenance_model
+from estatecore_backend.ai_modules.training.train_utility_forecast import train_utility_model
+from estatecore_backend.ai_modules.training.train_revenue_leakage import train_revenue_model
+from estatecore_backend.ai_modules.training.train_asset_health_score import train_asset_health_model
+
+TRAINING_JOBS = {
+    "Lease Model": train_lease_model,
+    "Rent Delay Model": train_rent_delay_model,
+    "Maintenance Model": train_maintenance_model,
+    "Utility Model": train_utility_model,
+    "Revenue Model": train_revenue_model,
+    "Asset Health Model": train_asset_health_model,
+}
 
 def safe_train(model_name, fn):
     log = TrainingLog.query.filter_by(model_name=model_name).first()
@@ -24,12 +33,8 @@ def safe_train(model_name, fn):
 def schedule_jobs():
     scheduler = BackgroundScheduler()
 
-    scheduler.add_job(lambda: safe_train("Lease Model", train_lease_model), 'interval', days=30)
-    scheduler.add_job(lambda: safe_train("Rent Delay Model", train_rent_delay_model), 'interval', days=30)
-    scheduler.add_job(lambda: safe_train("Maintenance Model", train_maintenance_model), 'interval', days=30)
-    scheduler.add_job(lambda: safe_train("Utility Model", train_utility_model), 'interval', days=30)
-    scheduler.add_job(lambda: safe_train("Revenue Model", train_revenue_model), 'interval', days=30)
-    scheduler.add_job(lambda: safe_train("Asset Health Model", train_asset_health_model), 'interval', days=30)
+    for model_name, fn in TRAINING_JOBS.items():
+        scheduler.add_job(safe_train, 'interval', days=30, args=[model_name, fn])
 
     scheduler.start()
     print("🧠 Smart AI scheduler with toggle control loaded.")
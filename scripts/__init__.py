@@ -0,0 +1,14 @@
+"""
+Maintenance and seed scripts
+
+The scripts import their siblings by bare name (``from _seed_context import
+get_app``), which works when run as ``python scripts/<name>.py``. Putting this
+directory on sys.path keeps those imports working under
+``python -m scripts.<name>`` too.
+"""
+import os
+import sys
+
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
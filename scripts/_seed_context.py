@@ -0,0 +1,13 @@
+"""
+Shared Flask app for the seed scripts
+
+create_app() registers every blueprint and imports all models; scripts
+that run in the same process share one instance through get_app().
+"""
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def get_app():
+    from estatecore_backend import create_app
+    return create_app()
@@ -2,19 +2,22 @@ import os
 from getpass import getpass
 
 def run(seed_email, seed_password, role):
-    from estatecore_backend import create_app, db
+    from sqlalchemy.dialects.postgresql import insert
+    from estatecore_backend import db
     from estatecore_backend.models import User
-    app = create_app()
+    from _seed_context import get_app
+    app = get_app()
     with app.app_context():
-        u = User.query.filter_by(email=seed_email).first()
-        if u:
-            u.set_password(seed_password)
-            u.role = role
-            u.is_active = True
-        else:
-            u = User(email=seed_email, role=role, is_active=True)
-            u.set_password(seed_password)
-            db.session.add(u)
+        # Hash through the model so the method matches User.set_password
+        hashed = User()
+        hashed.set_password(seed_password)
+        values = {"password_hash": hashed.password_hash, "role": role, "is_active": True}
+        # One atomic INSERT ... ON CONFLICT (email) DO UPDATE instead of select-then-write
+        db.session.execute(
+            insert(User)
+            .values(email=seed_email, **values)
+            .on_conflict_do_update(index_elements=[User.email], set_=values)
+        )
         db.session.commit()
         print(f"Seeded/updated: {seed_email} ({role})")
 
@@ -1,28 +1,19 @@
+import argparse
 import os
 from datetime import date, timedelta
-from sqlalchemy import text
+from getpass import getpass
+from sqlalchemy import select, text
 from sqlalchemy.exc import IntegrityError
 from flask import Flask
 
 # Your app + db
-from estatecore_backend import create_app
 from estatecore_backend.models import db
+from _seed_context import get_app
 
-app: Flask = create_app()
+app: Flask = get_app()
 
-def is_postgres():
-    url = os.getenv("DATABASE_URL", "")
-    return url.startswith("postgres")
-
-def exec_sql(sql, **params):
-    with app.app_context():
-        db.session.execute(text(sql), params)
-        db.session.commit()
-
-def get_scalar(sql, **params):
-    with app.app_context():
-        res = db.session.execute(text(sql), params).scalar()
-        return res
+# Resolved once; the fallback paths below check it repeatedly
+IS_POSTGRES = os.getenv("DATABASE_URL", "").startswith("postgres")
 
 def ensure_admin():
     # Tries ORM first; falls back to SQL if no model/metadata available
@@ -33,8 +24,9 @@ def ensure_admin():
             if not role:
                 role = Role(name="admin")
                 db.session.add(role)
-                db.session.commit()
-            user = User.query.filter_by(email="admin@example.com").first()
+            user = db.session.execute(
+                select(User).where(User.email == "admin@example.com")
+            ).scalar_one_or_none()
             if not user:
                 user = User(email="admin@example.com", full_name="System Admin")
                 # If you use werkzeug security:
@@ -45,20 +37,23 @@ def ensure_admin():
                 if hasattr(user, "roles"):
                     user.roles.append(role)
                 db.session.add(user)
-                db.session.commit()
+            # Role and user land in one transaction
+            db.session.commit()
             print("✔ admin@example.com / admin123")
     except Exception as e:
         # Raw SQL fallback (Postgres upsert)
-        if is_postgres():
-            exec_sql("""
-                INSERT INTO roles (name) VALUES ('admin')
-                ON CONFLICT (name) DO NOTHING;
-            """)
-            exec_sql("""
-                INSERT INTO users (email, full_name, password)
-                VALUES (:email, :name, :pwd)
-                ON CONFLICT (email) DO NOTHING;
-            """, email="admin@example.com", name="System Admin", pwd="admin123")
+        if IS_POSTGRES:
+            with app.app_context():
+                db.session.execute(text("""
+                    INSERT INTO roles (name) VALUES ('admin')
+                    ON CONFLICT (name) DO NOTHING;
+                """))
+                db.session.execute(text("""
+                    INSERT INTO users (email, full_name, password)
+                    VALUES (:email, :name, :pwd)
+                    ON CONFLICT (email) DO NOTHING;
+                """), {"email": "admin@example.com", "name": "System Admin", "pwd": "admin123"})
+                db.session.commit()
             print("✔ admin (raw SQL fallback). Note: password is plaintext unless your app hashes on save.")
         else:
             print(f"⚠ Skipped admin seed (no ORM and not Postgres): {e}")
@@ -111,16 +106,19 @@ def seed_core():
     except Exception as e:
         # Fallback: raw SQL with common table/column names; safe to skip if tables differ
         print(f"ℹ ORM seed skipped ({e}); trying raw SQL fallback…")
-        if is_postgres():
+        if IS_POSTGRES:
             try:
-                exec_sql("INSERT INTO properties (name, address) VALUES ('Sunset Villas','123 Palm Ave') ON CONFLICT DO NOTHING;")
-                pid = get_scalar("SELECT id FROM properties WHERE name='Sunset Villas' LIMIT 1;")
-                if pid:
-                    exec_sql("INSERT INTO units (code, bedrooms, bathrooms, property_id) VALUES ('A-101',2,1,:pid) ON CONFLICT DO NOTHING;", pid=pid)
-                tid = get_scalar("SELECT id FROM tenants WHERE email='tenant1@example.com' LIMIT 1;")
-                if not tid:
-                    exec_sql("""INSERT INTO tenants (first_name,last_name,email,phone)
-                                VALUES ('Taylor','Jones','tenant1@example.com','555-0101')""")
+                # One transaction for the whole fallback instead of a commit per statement
+                with app.app_context():
+                    db.session.execute(text("INSERT INTO properties (name, address) VALUES ('Sunset Villas','123 Palm Ave') ON CONFLICT DO NOTHING;"))
+                    pid = db.session.execute(text("SELECT id FROM properties WHERE name='Sunset Villas' LIMIT 1;")).scalar()
+                    if pid:
+                        db.session.execute(text("INSERT INTO units (code, bedrooms, bathrooms, property_id) VALUES ('A-101',2,1,:pid) ON CONFLICT DO NOTHING;"), {"pid": pid})
+                    tid = db.session.execute(text("SELECT id FROM tenants WHERE email='tenant1@example.com' LIMIT 1;")).scalar()
+                    if not tid:
+                        db.session.execute(text("""INSERT INTO tenants (first_name,last_name,email,phone)
+                                    VALUES ('Taylor','Jones','tenant1@example.com','555-0101')"""))
+                    db.session.commit()
                 print("✔ Core sample data seeded (raw SQL fallback)")
             except IntegrityError:
                 print("✔ Core sample data already exists (raw SQL fallback)")
@@ -129,12 +127,35 @@ def seed_core():
         else:
             print("⚠ No fallback executed (not Postgres).")
 
-if __name__ == "__main__":
+def seed_super_admin(email, role):
+    from create_super_admin import run
+    password = os.environ.get("SEED_ADMIN_PASSWORD") or getpass("Password for super admin: ")
+    run(email, password, role)
+
+def main(argv=None):
+    # One entry point for every seed, so a single process shares get_app()
+    parser = argparse.ArgumentParser(description="Seed the EstateCore database")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("all", help="demo admin and core sample data (default)")
+    sub.add_parser("admin", help="demo admin@example.com account")
+    sub.add_parser("core", help="property/unit/tenant/lease sample data")
+    super_admin_parser = sub.add_parser("super-admin", help="create or update a super admin")
+    super_admin_parser.add_argument("--email", default=os.environ.get("SEED_ADMIN_EMAIL", "admin@example.com"))
+    super_admin_parser.add_argument("--role", default=os.environ.get("SEED_ADMIN_ROLE", "super_admin"))
+    args = parser.parse_args(argv)
+
     with app.app_context():
         try:
-            ensure_admin()
-            seed_core()
+            if args.command in (None, "all", "admin"):
+                ensure_admin()
+            if args.command in (None, "all", "core"):
+                seed_core()
+            if args.command == "super-admin":
+                seed_super_admin(args.email, args.role)
             print("✅ Seeding complete")
         except Exception as e:
             print(f"❌ Seeding failed: {e}")
             raise
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 def compute_ai_risk_score(description):
     # Placeholder for AI prediction
     # Could use keywords (e.g., "water leak" = high risk)
-    if "leak" in description.lower():
+    text = description.lower()
+    if "leak" in text:
         return 0.8
-    if "urgent" in description.lower():
+    if "urgent" in text:
         return 0.9
     return 0.2
@@ -1,28 +1,50 @@
 from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy import Date, Integer, cast, func, literal, update
 from estatecore_backend.models.rent import Rent
 from estatecore_backend.models import db
 from utils.email import send_rent_reminder
 from utils.sms import send_rent_reminder_sms
 from datetime import datetime, timedelta
 
+GRACE_DAYS = 5  # Default grace days
+LATE_FEE_PER_DAY = 50  # Default fee
+
+def _days_past(cutoff):
+    """SQL expression for the whole days between Rent.due_date and cutoff"""
+    cutoff = literal(cutoff, Date)
+    if db.engine.dialect.name == 'sqlite':
+        # SQLite stores dates as text; subtracting them would compare strings
+        return cast(func.julianday(cutoff) - func.julianday(Rent.due_date), Integer)
+    # date - date is an integer day count in Postgres
+    return cutoff - Rent.due_date
+
 def apply_late_fees():
-    today = datetime.utcnow().date()
-    rents = Rent.query.filter_by(status='unpaid').all()
-    for rent in rents:
-        grace = 5  # Default grace days
-        fee_per_day = 50  # Default fee
-        if today > rent.due_date + timedelta(days=grace):
-            days_late = (today - rent.due_date - timedelta(days=grace)).days
-            rent.late_fee = days_late * fee_per_day
-            db.session.commit()
+    cutoff = datetime.utcnow().date() - timedelta(days=GRACE_DAYS)
+    # One UPDATE for all overdue rents
+    db.session.execute(
+        update(Rent)
+        .where(Rent.status == 'unpaid', Rent.due_date < cutoff)
+        .values(late_fee=_days_past(cutoff) * LATE_FEE_PER_DAY)
+    )
+    db.session.commit()
 
 def send_reminders():
     rents = Rent.query.filter_by(status='unpaid').all()
-    for rent in rents:
-        send_rent_reminder(rent)
-        send_rent_reminder_sms(rent)
-        rent.reminders_sent += 1
-        db.session.commit()
+    sent_ids = []
+    try:
+        for rent in rents:
+            send_rent_reminder(rent)
+            send_rent_reminder_sms(rent)
+            sent_ids.append(rent.id)
+    finally:
+        # Count every reminder that went out, even if a later send failed
+        if sent_ids:
+            db.session.execute(
+                update(Rent)
+                .where(Rent.id.in_(sent_ids))
+                .values(reminders_sent=Rent.reminders_sent + 1)
+            )
+            db.session.commit()
 
 scheduler = BackgroundScheduler()
 scheduler.add_job(apply_late_fees, 'interval', hours=24)
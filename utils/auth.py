@@ -1,21 +0,0 @@
-from flask import Blueprint, request, jsonify, current_app
-from estatecore_backend.models import User
-import jwt
-from datetime import datetime, timedelta
-
-auth_bp = Blueprint('auth', __name__)
-
-@auth_bp.route('/auth/login', methods=['POST'])
-def login():
-    data = request.json
-    email = data.get('email')
-    password = data.get('password')
-
-    user = User.query.filter_by(email=email).first()
-    if user and user.check_password(password):
-        token = jwt.encode({
-            'user_id': user.id,
-            'exp': datetime.utcnow() + timedelta(hours=24)
-        }, current_app.config['SECRET_KEY'], algorithm='HS256')
-        return jsonify({'token': token})
-    return jsonify({'error': 'Invalid credentials'}), 401
@@ -0,0 +1,27 @@
+"""
+orjson-backed JSON provider for EstateCore Flask apps
+"""
+import orjson
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+# Dates/datetimes are passed through to Flask's default hook so responses
+# keep the same wire format as the stock provider.
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _dumpb(obj):
+    return orjson.dumps(obj, default=DefaultJSONProvider.default, option=_OPTIONS)
+
+
+class ORJSONProvider(JSONProvider):
+    """Serialize with orjson; install with ``app.json = ORJSONProvider(app)``"""
+
+    def dumps(self, obj, **kwargs):
+        return _dumpb(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_dumpb(obj), mimetype="application/json")
@@ -1,5 +1,26 @@
+import os
+import tempfile
+
+# Rendered rent receipts live in an app-owned directory, not the shared /tmp.
+# The default, instance/receipts, is git-ignored and safe to clear; paid
+# receipts are simply re-rendered on the next request.
+RECEIPT_CACHE_DIR = os.environ.get(
+    "RECEIPT_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "instance", "receipts"),
+)
+
+
 def generate_rent_receipt(rent):
-    path = f"/tmp/rent_receipt_{rent.id}.pdf"
+    os.makedirs(RECEIPT_CACHE_DIR, mode=0o700, exist_ok=True)
+    # A paid rent's receipt never changes, so reuse the file rendered for
+    # this (rent, paid_on) pair; unpaid receipts are rendered every time
+    if rent.paid_on:
+        paid_key = rent.paid_on.isoformat().replace(":", "")
+        path = os.path.join(RECEIPT_CACHE_DIR, f"rent_receipt_{rent.id}_{paid_key}.pdf")
+        if os.path.exists(path):
+            return path
+    else:
+        path = os.path.join(RECEIPT_CACHE_DIR, f"rent_receipt_{rent.id}.pdf")
     from fpdf import FPDF
     pdf = FPDF()
     pdf.add_page()
@@ -11,7 +32,16 @@ def generate_rent_receipt(rent):
     pdf.cell(200, 10, txt=f"Paid: {rent.paid_on}", ln=5)
     pdf.cell(200, 10, txt=f"Status: {rent.status}", ln=6)
     pdf.cell(200, 10, txt=f"Late Fee: {rent.late_fee}", ln=7)
-    pdf.output(path)
+    # Render to a private temp file and rename it into place, so `path`
+    # only ever exists as a complete PDF
+    fd, tmp_path = tempfile.mkstemp(suffix=".pdf", dir=RECEIPT_CACHE_DIR)
+    os.close(fd)
+    try:
+        pdf.output(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
     return path
 def generate_payment_receipt(payment):
     path = f"/tmp/payment_receipt_{payment.id}.pdf"
@@ -1,5 +1,12 @@
 # wsgi.py at project root
 
+from sqlalchemy.orm import configure_mappers
+
 from estatecore_backend import create_app
 
 app = create_app()
+
+# Compile ORM mappers at import time; with gunicorn's preload_app this runs
+# once in the master and forked workers skip it on their first request
+with app.app_context():
+    configure_mappers()